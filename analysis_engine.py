@@ -1,11 +1,59 @@
+import hashlib
+import numpy as np
 import pandas as pd
 import streamlit as st
 from datetime import datetime
 from config import AppConfig
 
+
+@st.cache_data(show_spinner=False, max_entries=16, ttl=24 * 60 * 60)
+def _analyze_category_cached(content_key, category_name, our_brand, _df):
+    """카테고리별 분석 결과 캐시 (데이터 내용 digest + 카테고리명 + 우리 브랜드 기준)
+    
+    위젯 조작으로 스크립트가 다시 실행되어도 같은 데이터는 다시 그룹핑/집계하지 않습니다.
+    Streamlit의 DataFrame 해시는 큰 표에서 일부 행만 샘플링하므로, 데이터는 _df로 넘겨
+    해시하지 않고 전체 내용으로 만든 content_key로 캐시를 구분합니다.
+    
+    Args:
+        content_key (str): 데이터 전체 내용의 digest (_dataframe_digest)
+        category_name (str): 카테고리 이름 (수제 제품, 전체 제품)
+        our_brand (str): 우리 브랜드명
+        _df (DataFrame): 분석할 카테고리 데이터
+        
+    Returns:
+        dict: 카테고리 분석 결과
+    """
+    return BusinessAnalyzer(our_brand)._analyze_category(_df, category_name)
+
+
+def _dataframe_digest(df):
+    """DataFrame 전체 내용(컬럼명, dtype, 모든 행 값)의 digest
+    
+    Args:
+        df (DataFrame): 대상 데이터프레임
+        
+    Returns:
+        str: sha1 hex digest
+    """
+    digest = hashlib.sha1(repr([(str(col), str(dtype)) for col, dtype in df.dtypes.items()]).encode('utf-8'))
+    digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
 class BusinessAnalyzer:
     """수정과 시장 분석의 핵심 비즈니스 로직을 담당하는 클래스"""
     
+    # 분석에서 실제로 참조하는 컬럼 (나머지는 통합 전에 제외)
+    ANALYSIS_COLUMNS = [
+        '브랜드',
+        '제품명',
+        '용량(ml)',
+        '개수',
+        '최저가(배송비 포함)',
+        '최저가 단위가격(100ml당)',
+        '공장형 여부',
+        '플랫폼'
+    ]
+    
     def __init__(self, our_brand=None):
         """비즈니스 분석기 초기화
         
@@ -28,17 +76,31 @@ class BusinessAnalyzer:
         if not df_list:
             return None, None, None
         
-        # 모든 데이터 통합
-        combined_df = pd.concat(df_list, ignore_index=True)
+        # 분석에 필요한 컬럼만 남겨서 통합 (가격 원본/리뷰 등 미사용 컬럼은 복사하지 않음)
+        # 모든 파일을 같은 컬럼 순서로 맞춰 두면 concat 시 컬럼 정렬/재배치가 필요 없음
+        combined_columns = [
+            col for col in self.ANALYSIS_COLUMNS
+            if any(col in df.columns for df in df_list)
+        ]
+        combined_df = pd.concat(
+            [df.reindex(columns=combined_columns) for df in df_list],
+            ignore_index=True
+        )
+        
+        # 반복 비교/그룹핑되는 문자열 컬럼은 category로 변환 (정수 코드 비교/해시)
+        # 파일별로 변환하면 카테고리가 달라 concat 시 object로 되돌아가므로 통합 후에 변환
+        for col in ['브랜드', '제품명', '플랫폼']:
+            if col in combined_df.columns:
+                combined_df[col] = combined_df[col].astype('category')
         
         # 1차: 수제 제품만 필터링 (공장형 여부 = 0)
         handmade_df, all_products_df = self._separate_product_types(combined_df)
         
         # 수제 제품 분석
-        handmade_analysis = self._analyze_category(handmade_df, "수제 제품")
+        handmade_analysis = _analyze_category_cached(_dataframe_digest(handmade_df), "수제 제품", self.our_brand, handmade_df)
         
         # 전체 제품 분석 (수제 + 공장형)
-        all_analysis = self._analyze_category(all_products_df, "전체 제품")
+        all_analysis = _analyze_category_cached(_dataframe_digest(all_products_df), "전체 제품", self.our_brand, all_products_df)
         
         # 통합 분석 결과
         analysis_results = {
@@ -53,13 +115,16 @@ class BusinessAnalyzer:
         return analysis_results, handmade_df, all_products_df
     
     def _separate_product_types(self, combined_df):
-        """수제 제품과 전체 제품으로 분리"""
+        """수제 제품과 전체 제품으로 분리
+        
+        이후 분석은 읽기 전용이므로 복사하지 않음 (불리언 인덱싱 결과는 이미 새 DataFrame)
+        """
         if '공장형 여부' in combined_df.columns:
-            handmade_df = combined_df[combined_df['공장형 여부'] == 0].copy()
-            all_products_df = combined_df.copy()
+            handmade_df = combined_df[combined_df['공장형 여부'] == 0]
+            all_products_df = combined_df
         else:
-            handmade_df = combined_df.copy()
-            all_products_df = combined_df.copy()
+            handmade_df = combined_df
+            all_products_df = combined_df
             st.warning("'공장형 여부' 컬럼을 찾을 수 없습니다.")
         
         return handmade_df, all_products_df
@@ -69,11 +134,14 @@ class BusinessAnalyzer:
         if df.empty:
             return self._create_empty_analysis_result(category_name)
         
+        # 고유 제품 그룹핑은 기본 통계/우리 제품/점유율 분석에 공통으로 쓰이므로 한 번만 계산
+        unique_products = self._calculate_unique_products(df)
+        
         # 기본 통계
-        basic_stats = self._calculate_basic_statistics(df)
+        basic_stats = self._calculate_basic_statistics(df, unique_products)
         
         # 비즈니스 인사이트 분석
-        business_insights = self._analyze_business_insights(df)
+        business_insights = self._analyze_business_insights(df, unique_products)
         
         # 결과 통합
         category_results = {
@@ -97,26 +165,47 @@ class BusinessAnalyzer:
             'business_insights': {}
         }
     
-    def _calculate_basic_statistics(self, df):
+    def _calculate_basic_statistics(self, df, unique_products):
         """기본 통계 계산"""
-        # 서로 브랜드와 경쟁사 분리
-        our_products = df[df['브랜드'] == self.our_brand].copy()
-        competitor_products = df[df['브랜드'] != self.our_brand].copy()
-        
-        # 고유 제품 계산을 위한 그룹핑
-        unique_products = self._calculate_unique_products(df)
-        our_unique_products = unique_products[unique_products['브랜드'] == self.our_brand]
-        competitor_unique_products = unique_products[unique_products['브랜드'] != self.our_brand]
+        # 서로 브랜드 여부는 한 번만 비교하고, 개수는 마스크 합계로 계산 (DataFrame 분리 불필요)
+        our_products_count = int((df['브랜드'] == self.our_brand).sum())
+        our_unique_products_count = int((unique_products['브랜드'] == self.our_brand).sum())
         
         return {
             'total_products_analyzed': len(df),
             'total_unique_products': len(unique_products),
-            'our_products_count': len(our_products),
-            'our_unique_products_count': len(our_unique_products),
-            'competitor_products_count': len(competitor_products),
-            'competitor_unique_products_count': len(competitor_unique_products)
+            'our_products_count': our_products_count,
+            'our_unique_products_count': our_unique_products_count,
+            'competitor_products_count': len(df) - our_products_count,
+            'competitor_unique_products_count': len(unique_products) - our_unique_products_count
         }
     
+    def _split_by_brand(self, df):
+        """우리 브랜드 제품과 경쟁사 제품 분리 (브랜드 비교는 한 번만 수행)
+        
+        Args:
+            df (DataFrame): 분리할 데이터프레임
+            
+        Returns:
+            tuple: (우리 제품 DataFrame, 경쟁사 제품 DataFrame)
+        """
+        is_ours = df['브랜드'] == self.our_brand
+        return df[is_ours], df[~is_ours]
+    
+    @staticmethod
+    def _format_volume(volume):
+        """용량 표시용 숫자 정리 (float32 저장 시 생기는 180.3000030517578 같은 오차 제거)
+        
+        정수 용량은 소수점 없이(1000.0 → 1000), 그 외에는 소수점 둘째 자리까지 표시합니다.
+        
+        Args:
+            volume (float): 용량(ml) 값
+            
+        Returns:
+            str: 표시용 용량 문자열
+        """
+        return f"{float(volume):.2f}".rstrip('0').rstrip('.')
+    
     def _calculate_unique_products(self, df):
         """고유 제품 수 계산"""
         # 필수 컬럼 체크
@@ -124,32 +213,39 @@ class BusinessAnalyzer:
         available_cols = [col for col in required_for_analysis if col in df.columns]
         
         if len(available_cols) < 2:
-            return df.groupby(['브랜드']).size().reset_index(name='count')
+            return df.groupby(['브랜드'], observed=True).size().reset_index(name='count')
         
         # 제품 그룹핑
         group_cols = available_cols
+        grouped = df.groupby(group_cols, observed=True)
         agg_dict = {}
         
         if '최저가(배송비 포함)' in df.columns:
             agg_dict['최저가(배송비 포함)'] = 'min'
         if '최저가 단위가격(100ml당)' in df.columns:
             agg_dict['최저가 단위가격(100ml당)'] = 'min'
+        
+        if not agg_dict and '플랫폼' not in df.columns:
+            return grouped.size().reset_index(name='count')
+        
+        unique_products = grouped.agg(agg_dict) if agg_dict else grouped.size().to_frame(name='count')
+        
         if '플랫폼' in df.columns:
-            agg_dict['플랫폼'] = lambda x: list(x.unique())
+            # category 컬럼은 agg에서 list를 반환하는 함수를 지원하지 않으므로 별도 집계
+            # 중복 (제품, 플랫폼) 행을 먼저 제거해 그룹마다 unique() 람다를 호출하지 않음
+            platform_pairs = df.drop_duplicates(subset=group_cols + ['플랫폼'])
+            unique_products['플랫폼'] = platform_pairs.groupby(group_cols, observed=True)['플랫폼'].apply(list)
         
-        if not agg_dict:
-            unique_products = df.groupby(group_cols).size().reset_index(name='count')
-        else:
-            unique_products = df.groupby(group_cols).agg(agg_dict).reset_index()
+        unique_products = unique_products.reset_index()
         
         return unique_products
     
-    def _analyze_business_insights(self, df):
+    def _analyze_business_insights(self, df, unique_products):
         """비즈니스 인사이트 분석"""
         insights = {}
         
         # 1. 우리 제품 상세 현황
-        insights['our_product_details'] = self._analyze_our_products(df)
+        insights['our_product_details'] = self._analyze_our_products(unique_products)
         
         # 2. 플랫폼별 가격 경쟁력
         insights['detailed_competitiveness'] = self._analyze_price_competitiveness(df)
@@ -158,122 +254,112 @@ class BusinessAnalyzer:
         insights['volume_count_market'] = self._analyze_volume_market(df)
         
         # 4. 브랜드별 시장 점유율
-        insights['market_share'] = self._analyze_market_share(df)
+        insights['market_share'] = self._analyze_market_share(unique_products)
         
         return insights
     
-    def _analyze_our_products(self, df):
-        """우리 제품 상세 분석"""
-        our_products = df[df['브랜드'] == self.our_brand].copy()
-        
-        if our_products.empty:
-            return []
-        
-        unique_our_products = self._calculate_unique_products(our_products)
+    def _analyze_our_products(self, unique_products):
+        """우리 제품 상세 분석 (브랜드가 그룹 키에 포함되므로 전체 고유 제품에서 선택)"""
+        unique_our_products = unique_products[unique_products['브랜드'] == self.our_brand]
         
         if unique_our_products.empty:
             return []
         
-        our_product_details = []
-        
-        for _, product in unique_our_products.iterrows():
-            product_info = {
-                '브랜드': product.get('브랜드', ''),
-                '제품명': product.get('제품명', ''),
-                '용량': f"{product.get('용량(ml)', 0)}ml" if pd.notna(product.get('용량(ml)')) else 'N/A',
-                '개수': f"{product.get('개수', 0)}개" if pd.notna(product.get('개수')) else 'N/A'
-            }
-            
-            # 가격 정보 추가
-            if '최저가(배송비 포함)' in product.index and pd.notna(product['최저가(배송비 포함)']):
-                product_info['최저가'] = f"{product['최저가(배송비 포함)']:,.0f}원"
-            else:
-                product_info['최저가'] = 'N/A'
-            
-            if '최저가 단위가격(100ml당)' in product.index and pd.notna(product['최저가 단위가격(100ml당)']):
-                product_info['단위가격'] = f"{product['최저가 단위가격(100ml당)']:,.0f}원/100ml"
-            else:
-                product_info['단위가격'] = 'N/A'
-            
-            if '플랫폼' in product.index and isinstance(product['플랫폼'], list):
-                product_info['판매플랫폼'] = ', '.join(product['플랫폼'])
-            else:
-                product_info['판매플랫폼'] = 'N/A'
-            
+        def format_column(col, formatter):
+            """결측이 아닌 값만 포맷하고 결측/누락 컬럼은 'N/A'로 표시"""
+            if col not in unique_our_products.columns:
+                return 'N/A'
+            return unique_our_products[col].astype(object).map(formatter, na_action='ignore').fillna('N/A')
+        
+        def text_column(col):
+            """category 컬럼을 일반 문자열 값으로 (누락 컬럼은 빈 문자열)"""
+            if col not in unique_our_products.columns:
+                return ''
+            return unique_our_products[col].astype(object)
+        
+        # 행마다 dict를 만들며 f-string을 반복하지 않도록 표시용 컬럼을 한 번에 포맷
+        product_details = pd.DataFrame({
+            '브랜드': text_column('브랜드'),
+            '제품명': text_column('제품명'),
+            '용량': format_column('용량(ml)', lambda v: f"{self._format_volume(v)}ml"),
+            '개수': format_column('개수', '{}개'.format),
+            '최저가': format_column('최저가(배송비 포함)', '{:,.0f}원'.format),
+            '단위가격': format_column('최저가 단위가격(100ml당)', '{:,.0f}원/100ml'.format),
+            '판매플랫폼': format_column('플랫폼', lambda p: ', '.join(p) if isinstance(p, list) else 'N/A'),
             # 기본적인 정보만 포함 (리뷰/평점 분석은 단순화)
-            product_info['시장반응도'] = "분석 중"
-            product_info['고객만족도'] = "분석 중"
-            product_info['브랜드내순위'] = "분석 중"
-            
-            our_product_details.append(product_info)
+            '시장반응도': "분석 중",
+            '고객만족도': "분석 중",
+            '브랜드내순위': "분석 중"
+        }, index=unique_our_products.index)
         
-        return our_product_details
+        return product_details.to_dict('records')
     
     def _analyze_price_competitiveness(self, df):
         """플랫폼별 가격 경쟁력 분석 (단순화 버전)"""
         if not all(col in df.columns for col in ['최저가 단위가격(100ml당)', '플랫폼']):
             return {}
         
-        our_products = df[df['브랜드'] == self.our_brand]
-        competitor_products = df[df['브랜드'] != self.our_brand]
+        price_col = '최저가 단위가격(100ml당)'
+        our_products, competitor_products = self._split_by_brand(df)
         
         competitiveness = {}
         
-        for platform in df['플랫폼'].unique():
-            if pd.isna(platform):
-                continue
-            
-            our_platform_data = our_products[our_products['플랫폼'] == platform]
-            competitor_platform_data = competitor_products[competitor_products['플랫폼'] == platform]
-            
-            if our_platform_data.empty or competitor_platform_data.empty:
-                continue
+        # 플랫폼별 경쟁사 단위가격 통계는 제품마다 동일하므로 한 번에 집계
+        competitor_stats = competitor_products.groupby('플랫폼', observed=True)[price_col].agg(
+            ['mean', 'min', 'max', 'count']
+        )
+        competitor_stats = competitor_stats[competitor_stats['count'] > 0]
+        
+        # 가격이 있는 우리 제품에 플랫폼별 경쟁사 통계를 한 번의 조인으로 연결
+        compared = our_products[our_products[price_col].notna()].join(competitor_stats, on='플랫폼', how='inner')
+        
+        if compared.empty:
+            return competitiveness
+        
+        our_price = compared[price_col]
+        price_gap = our_price - compared['mean']
+        price_gap_percent = (price_gap / compared['mean'] * 100).where(compared['mean'] > 0, 0)
+        
+        # 시장 위치 판단 (행 단위 분기 대신 벡터 연산)
+        position = np.select(
+            [our_price <= compared['min'], our_price <= compared['mean'], our_price <= compared['max']],
+            ["🎯 최저가", "📊 평균 이하", "📈 평균 이상"],
+            default="💰 최고가"
+        )
+        
+        label_parts = compared.reindex(columns=['제품명', '용량(ml)', '개수'])
+        
+        compared = compared.assign(
+            제품=(label_parts['제품명'].astype(object).fillna('').astype(str) + ' '
+                + label_parts['용량(ml)'].map(lambda volume: f"{self._format_volume(volume)}ml") + ' '
+                + label_parts['개수'].map(lambda count: f"{count}개")),
+            우리_단위가격=our_price.map('{:,.0f}원'.format),
+            가격차이=price_gap.map('{:+,.0f}원'.format),
+            가격차이_퍼센트=price_gap_percent.map('{:+.1f}%'.format),
+            시장_포지션=position
+        )
+        
+        result_cols = ['제품', '우리_단위가격', '가격차이', '가격차이_퍼센트', '시장_포지션']
+        
+        for platform, platform_rows in compared.groupby('플랫폼', observed=True, sort=False):
+            platform_stats = competitor_stats.loc[platform]
             
-            platform_analysis = []
-            
-            for _, our_product in our_platform_data.iterrows():
-                if pd.isna(our_product.get('최저가 단위가격(100ml당)')):
-                    continue
-                
-                our_price = our_product['최저가 단위가격(100ml당)']
-                competitor_prices = competitor_platform_data['최저가 단위가격(100ml당)'].dropna()
-                
-                if len(competitor_prices) == 0:
-                    continue
-                
-                competitor_avg = competitor_prices.mean()
-                competitor_min = competitor_prices.min()
-                competitor_max = competitor_prices.max()
-                
-                price_gap = our_price - competitor_avg
-                price_gap_percent = (price_gap / competitor_avg) * 100 if competitor_avg > 0 else 0
-                
-                # 시장 위치 판단
-                if our_price <= competitor_min:
-                    position = "🎯 최저가"
-                elif our_price <= competitor_avg:
-                    position = "📊 평균 이하"
-                elif our_price <= competitor_max:
-                    position = "📈 평균 이상"
-                else:
-                    position = "💰 최고가"
-                
-                platform_analysis.append({
-                    '제품': f"{our_product.get('제품명', '')} {our_product.get('용량(ml)', 0)}ml {our_product.get('개수', 0)}개",
-                    '우리_단위가격': f"{our_price:,.0f}원",
-                    '경쟁사_평균': f"{competitor_avg:,.0f}원",
-                    '경쟁사_최저': f"{competitor_min:,.0f}원",
-                    '경쟁사_최고': f"{competitor_max:,.0f}원",
-                    '가격차이': f"{price_gap:+,.0f}원",
-                    '가격차이_퍼센트': f"{price_gap_percent:+.1f}%",
-                    '시장_포지션': position,
-                    '경쟁사_수': len(competitor_prices),
+            competitiveness[platform] = [
+                {
+                    '제품': row['제품'],
+                    '우리_단위가격': row['우리_단위가격'],
+                    '경쟁사_평균': f"{platform_stats['mean']:,.0f}원",
+                    '경쟁사_최저': f"{platform_stats['min']:,.0f}원",
+                    '경쟁사_최고': f"{platform_stats['max']:,.0f}원",
+                    '가격차이': row['가격차이'],
+                    '가격차이_퍼센트': row['가격차이_퍼센트'],
+                    '시장_포지션': row['시장_포지션'],
+                    '경쟁사_수': int(platform_stats['count']),
                     '비교_기준': "전체 시장",
                     '주요_경쟁사': ["분석 중"]
-                })
-            
-            if platform_analysis:
-                competitiveness[platform] = platform_analysis
+                }
+                for row in platform_rows[result_cols].to_dict('records')
+            ]
         
         return competitiveness
     
@@ -289,55 +375,64 @@ class BusinessAnalyzer:
                 return []
             
             # 용량+개수 조합별 제품 수 계산
-            volume_count_combinations = df_for_volume.groupby(['용량(ml)', '개수']).size().reset_index(name='제품수')
-            volume_count_combinations = volume_count_combinations.sort_values('제품수', ascending=False)
+            volume_keys = ['용량(ml)', '개수']
+            volume_count_combinations = df_for_volume.groupby(volume_keys).size().reset_index(name='제품수')
+            volume_count_combinations = volume_count_combinations.sort_values('제품수', ascending=False).head(
+                self.analysis_settings['top_volume_combinations']
+            )
             
-            our_products = df[df['브랜드'] == self.our_brand]
-            volume_count_market = []
+            # 조합별 우리 제품 수도 그룹 집계 한 번으로 계산해 상위 조합에 붙임
+            our_counts = df_for_volume[df_for_volume['브랜드'] == self.our_brand].groupby(volume_keys).size()
+            our_counts_in_combo = volume_count_combinations.join(
+                our_counts.rename('우리_제품수'), on=volume_keys
+            )['우리_제품수'].fillna(0)
             
-            for _, combo in volume_count_combinations.head(10).iterrows():
-                volume = combo['용량(ml)']
-                count = combo['개수']
-                total_products = combo['제품수']
-                
-                # 해당 조합에서 우리 제품 수
-                our_products_in_combo = len(our_products[
-                    (our_products['용량(ml)'] == volume) & 
-                    (our_products['개수'] == count)
-                ])
-                
-                combo_info = {
-                    '용량_개수': f"{volume}ml {count}개",
+            volume_count_market = [
+                {
+                    '용량_개수': f"{self._format_volume(volume)}ml {count}개",
                     '총_제품수': int(total_products),
                     '우리_제품수': int(our_products_in_combo),
                     '평균_단위가격': 'N/A',
                     '최저_단위가격': 'N/A',
                     '최고_단위가격': 'N/A'
                 }
-                
-                volume_count_market.append(combo_info)
+                for volume, count, total_products, our_products_in_combo in zip(
+                    volume_count_combinations['용량(ml)'].tolist(),
+                    volume_count_combinations['개수'].tolist(),
+                    volume_count_combinations['제품수'].tolist(),
+                    our_counts_in_combo.tolist()
+                )
+            ]
             
             return volume_count_market
             
         except Exception as e:
             return []
     
-    def _analyze_market_share(self, df):
+    def _analyze_market_share(self, unique_products):
         """브랜드별 시장 점유율 분석"""
         try:
-            unique_products = self._calculate_unique_products(df)
-            brand_share = unique_products['브랜드'].value_counts()
+            # 상위 브랜드만 필요하므로 전체 정렬 없이 집계한 뒤 부분 선택
+            # category의 value_counts는 카테고리(가나다) 순이므로, 동률 브랜드가 처음 등장한 순서를 따르도록
+            # 등장 순서로 다시 정렬 (미관측 브랜드도 함께 제외됨)
+            brands = unique_products['브랜드']
+            brand_share = brands.value_counts(sort=False).reindex(brands.unique())
             total_unique_products = len(unique_products)
             
-            brand_share_percent = {}
+            if total_unique_products == 0:
+                return {}
             
-            for brand, count in brand_share.head(10).items():
-                if pd.notna(brand) and total_unique_products > 0:
-                    percentage = (count / total_unique_products) * 100
-                    brand_share_percent[brand] = {
-                        '제품_수': int(count),
-                        '점유율_퍼센트': round(percentage, 1)
-                    }
+            # 상위 브랜드의 점유율을 한 번에 계산한 뒤 dict로 변환
+            top_brands = brand_share.nlargest(self.analysis_settings['top_brands_count'])
+            share_percent = (top_brands / total_unique_products * 100).round(1)
+            
+            brand_share_percent = {
+                brand: {
+                    '제품_수': int(count),
+                    '점유율_퍼센트': float(percentage)
+                }
+                for brand, count, percentage in zip(top_brands.index, top_brands.to_numpy(), share_percent.to_numpy())
+            }
             
             return brand_share_percent
             
@@ -4,8 +4,11 @@
 """
 
 import streamlit as st
-import json
+import orjson
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 # 모듈화된 컴포넌트들 임포트
 from config import AppConfig
@@ -15,16 +18,66 @@ from dashboard_components import DashboardRenderer
 from github_connector import GitHubStorage
 
 
+@st.cache_resource(show_spinner=False)
+def get_app_components():
+    """재실행마다 새로 만들 필요 없는 상태 없는 컴포넌트들을 한 번만 생성
+    
+    Streamlit은 위젯 조작마다 스크립트 전체를 다시 실행하므로,
+    설정값만 들고 있는 처리기/분석기/저장소 객체는 리소스 캐시로 재사용합니다.
+    
+    Returns:
+        tuple: (DataProcessor, BusinessAnalyzer, DashboardRenderer, GitHubStorage)
+    """
+    return DataProcessor(), BusinessAnalyzer(), DashboardRenderer(), GitHubStorage()
+
+
+@st.cache_resource(show_spinner=False)
+def get_github_upload_executor():
+    """GitHub 업로드 전용 작업 스레드 (업로드가 겹치지 않도록 1개만 사용)
+    
+    Returns:
+        ThreadPoolExecutor: 업로드 작업 실행기
+    """
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="github_upload")
+
+
+@st.cache_data(ttl=AppConfig.PROCESSING_SETTINGS['latest_analysis_ttl'], show_spinner=False)
+def load_latest_analysis_cached():
+    """GitHub 최신 분석 결과를 일정 시간 캐시 (새 세션/새로고침마다 다시 다운로드하지 않음)
+    
+    Returns:
+        dict or None: 분석 결과 데이터 또는 None
+    """
+    github_storage = get_app_components()[3]
+    return github_storage.load_latest_analysis()
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def serialize_analysis_cached(analysis_key, _analysis_data):
+    """분석 결과 JSON 직렬화 캐시 (분석 timestamp 기준 - 결과 dict 자체는 해시하지 않음)
+    
+    Args:
+        analysis_key (str): 분석 결과 식별자 (분석 timestamp)
+        _analysis_data (dict): 직렬화할 분석 결과
+        
+    Returns:
+        bytes: JSON 형태의 분석 결과 (UTF-8)
+    """
+    return orjson.dumps(_analysis_data, option=GitHubStorage.JSON_OPTIONS)
+
+
 class SujeonggwaApp:
     """수정과 시장 분석 메인 애플리케이션 클래스"""
     
     def __init__(self):
         """앱 초기화 - 모든 모듈 컴포넌트 초기화"""
         self.config = AppConfig()
-        self.data_processor = DataProcessor()
-        self.business_analyzer = BusinessAnalyzer()
-        self.dashboard_renderer = DashboardRenderer()
-        self.github_storage = GitHubStorage()
+        (
+            self.data_processor,
+            self.business_analyzer,
+            self.dashboard_renderer,
+            self.github_storage
+        ) = get_app_components()
         
         # 세션 상태 초기화
         self._initialize_session_state()
@@ -140,12 +193,28 @@ class SujeonggwaApp:
             progress_bar = st.progress(0)
             status_text = st.empty()
         
-        # 파일 처리
-        for i, uploaded_file in enumerate(uploaded_files):
-            status_text.text(f"{self.config.UI_MESSAGES['file_processing']}: {uploaded_file.name}")
-            progress_bar.progress((i + 1) / len(uploaded_files) * 0.4)
+        # 파일 처리 - UploadedFile은 스레드 안전하지 않으므로 내용을 먼저 읽어 둠
+        file_items = [(uploaded_file.name, uploaded_file.getvalue()) for uploaded_file in uploaded_files]
+        script_ctx = get_script_run_ctx()
+        
+        def load_file(file_item):
+            # 작업 스레드에서도 st.warning/st.error가 화면에 표시되도록 실행 컨텍스트 연결
+            add_script_run_ctx(threading.current_thread(), script_ctx)
+            filename, file_bytes = file_item
+            return self.data_processor.load_excel_bytes(file_bytes, filename)
+        
+        max_workers = min(self.config.PROCESSING_SETTINGS['max_file_workers'], len(file_items))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(load_file, file_item) for file_item in file_items]
+            filenames = {future: file_item[0] for future, file_item in zip(futures, file_items)}
             
-            df, platform, missing_cols = self.data_processor.load_and_standardize_excel(uploaded_file)
+            for i, future in enumerate(as_completed(futures)):
+                status_text.text(f"{self.config.UI_MESSAGES['file_processing']}: {filenames[future]}")
+                progress_bar.progress((i + 1) / len(file_items) * 0.4)
+        
+        # 업로드 순서대로 결과 수집
+        for future in futures:
+            df, platform, missing_cols = future.result()
             
             if df is not None:
                 df_list.append(df)
@@ -160,15 +229,18 @@ class SujeonggwaApp:
     def perform_analysis(self, df_list):
         """분석 수행
         
+        GitHub 업로드는 작업 스레드에서 시작만 하고 바로 반환하므로,
+        업로드가 진행되는 동안 대시보드를 먼저 그릴 수 있습니다.
+        
         Args:
             df_list (list): 처리된 DataFrame 리스트
             
         Returns:
-            tuple: (분석 결과, GitHub 저장 성공 여부)
+            tuple: (분석 결과, GitHub 업로드 Future 또는 None)
         """
         if not df_list:
             st.error("처리할 수 있는 파일이 없습니다.")
-            return None, False
+            return None, None
         
         # 분석 진행 표시
         with st.spinner(self.config.UI_MESSAGES['market_analysis']):
@@ -176,47 +248,97 @@ class SujeonggwaApp:
         
         if not analysis_results:
             st.error("분석 중 오류가 발생했습니다.")
-            return None, False
+            return None, None
         
-        # GitHub에 저장
-        github_success = False
-        with st.spinner(self.config.UI_MESSAGES['github_save']):
-            if self.github_storage.is_connected:
-                github_success = self.github_storage.auto_save_with_cleanup(
-                    analysis_results, keep_files=3
-                )
-            else:
-                st.info("GitHub 연결이 없어 분석 결과를 로컬에서만 표시합니다.")
-        
-        # 세션 상태에 저장
+        # 세션 상태에 저장 (직렬화는 분석 timestamp 기준으로 캐시)
+        analysis_key = analysis_results.get('timestamp', 'unknown')
         st.session_state.analysis_results = analysis_results
-        st.session_state.json_content = json.dumps(analysis_results, ensure_ascii=False, indent=2)
+        st.session_state.json_content = serialize_analysis_cached(analysis_key, analysis_results)
         st.session_state.timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         
-        return analysis_results, github_success
+        # GitHub에 저장 (백그라운드)
+        upload_future = None
+        if self.github_storage.is_connected:
+            upload_future = self._start_github_upload(analysis_results)
+        else:
+            st.info("GitHub 연결이 없어 분석 결과를 로컬에서만 표시합니다.")
+        
+        return analysis_results, upload_future
+    
+    def _start_github_upload(self, analysis_results):
+        """GitHub 저장/정리를 작업 스레드에서 시작
+        
+        저장 과정의 st.success/st.error 메시지는 대시보드보다 위에 미리 만들어 둔 영역에 표시됩니다.
+        
+        Args:
+            analysis_results (dict): 저장할 분석 결과
+            
+        Returns:
+            Future: GitHub 저장 성공 여부(bool)를 돌려주는 Future
+        """
+        message_container = st.container()
+        script_ctx = get_script_run_ctx()
+        
+        def upload():
+            # 작업 스레드에서도 저장 메시지가 화면에 표시되도록 실행 컨텍스트 연결
+            add_script_run_ctx(threading.current_thread(), script_ctx)
+            # 공유 GitHubStorage의 세션은 다른 세션의 스크립트 스레드도 쓰므로 업로드는 전용 세션 사용
+            self.github_storage.use_dedicated_session()
+            with message_container:
+                github_success = self.github_storage.auto_save_with_cleanup(analysis_results, keep_files=3)
+            
+            if github_success:
+                # 새 결과가 저장되었으므로 캐시된 이전 최신 결과는 버림
+                # (스크립트가 재실행되어 결과를 기다리지 않더라도 반드시 무효화되도록 작업 스레드에서 처리)
+                load_latest_analysis_cached.clear()
+            return github_success
+        
+        return get_github_upload_executor().submit(upload)
+    
+    def _finish_github_upload(self, upload_future):
+        """GitHub 업로드 완료를 기다려 저장 성공 여부 반환
+        
+        Args:
+            upload_future (Future or None): _start_github_upload가 돌려준 Future
+            
+        Returns:
+            bool: GitHub 저장 성공 여부
+        """
+        if upload_future is None:
+            return False
+        
+        try:
+            return upload_future.result()
+        except Exception as e:
+            st.error(f"GitHub 저장 중 오류: {str(e)}")
+            return False
     
     def load_previous_analysis(self):
         """이전 분석 결과 로드"""
         if not st.session_state.get('analysis_results'):
             with st.spinner("GitHub에서 최신 분석 결과를 불러오는 중..."):
-                latest_analysis = self.github_storage.load_latest_analysis()
+                latest_analysis = load_latest_analysis_cached()
                 
                 if latest_analysis:
+                    analysis_key = latest_analysis.get('timestamp', 'unknown')
                     st.session_state.analysis_results = latest_analysis
-                    st.session_state.json_content = json.dumps(latest_analysis, ensure_ascii=False, indent=2)
-                    st.session_state.timestamp = latest_analysis.get('timestamp', 'unknown')
+                    st.session_state.json_content = serialize_analysis_cached(analysis_key, latest_analysis)
+                    st.session_state.timestamp = analysis_key
                     st.success("✅ GitHub에서 최신 분석 결과를 불러왔습니다!")
+                else:
+                    # 불러오기 실패는 캐시하지 않고 다음 실행 때 다시 시도
+                    load_latest_analysis_cached.clear()
     
     def render_analysis_results(self, analysis_results, github_success):
         """분석 결과 렌더링
         
         Args:
             analysis_results (dict): 분석 결과
-            github_success (bool): GitHub 저장 성공 여부
+            github_success (bool or None): GitHub 저장 성공 여부 (None이면 저장 결과를 따로 표시)
         """
         self.dashboard_renderer.render_analysis_results(
             analysis_results,
-            st.session_state.get('json_content', ''),
+            st.session_state.get('json_content', b''),
             st.session_state.get('timestamp', 'unknown'),
             github_success
         )
@@ -234,15 +356,23 @@ class SujeonggwaApp:
         
         # 메인 로직
         if uploaded_files and st.session_state.get('run_analysis', False):
+            # 분석 요청 상태는 먼저 리셋 - 대시보드 표시/업로드 대기 중 위젯 조작으로 재실행되어도
+            # 같은 분석과 GitHub 저장이 다시 실행되지 않도록 함
+            st.session_state.run_analysis = False
+            
             # 새로운 분석 수행
             df_list = self.process_uploaded_files(uploaded_files)
-            analysis_results, github_success = self.perform_analysis(df_list)
+            analysis_results, upload_future = self.perform_analysis(df_list)
             
             if analysis_results:
-                self.render_analysis_results(analysis_results, github_success)
-            
-            # 분석 완료 후 상태 리셋
-            st.session_state.run_analysis = False
+                # 저장 결과 메시지 자리를 먼저 잡고, 업로드를 기다리지 않고 대시보드부터 표시
+                save_status = st.empty()
+                self.render_analysis_results(analysis_results, None)
+                
+                with st.spinner(self.config.UI_MESSAGES['github_save']):
+                    github_success = self._finish_github_upload(upload_future)
+                with save_status.container():
+                    self.dashboard_renderer.render_save_status(github_success)
             
         elif st.session_state.get('analysis_results') or not uploaded_files:
             # 기존 분석 결과 표시 또는 초기 화면
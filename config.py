@@ -46,6 +46,15 @@ class AppConfig:
         'main_competitors_count': 3      # 주요 경쟁사 표시 개수
     }
     
+    # ⚡ 처리 성능 관련 설정
+    PROCESSING_SETTINGS = {
+        'max_file_workers': 8,           # 엑셀 파일 병렬 처리 최대 스레드 수
+        'excel_cache_dir': '.cache',     # 엑셀 표준화 결과(Parquet) 캐시 디렉토리
+        'excel_cache_max_files': 50,     # Parquet 캐시 최대 보관 파일 수 (오래된 파일부터 삭제)
+        'github_listing_ttl': 30,        # GitHub 파일 목록 캐시 유지 시간 (초)
+        'latest_analysis_ttl': 300       # GitHub 최신 분석 결과 캐시 유지 시간 (초)
+    }
+    
     # 📁 GitHub 설정을 가져오는 함수
     @staticmethod
     def get_github_config():
@@ -68,6 +77,12 @@ class AppConfig:
         github_config = AppConfig.get_github_config()
         return f"https://api.github.com/repos/{github_config['repo']}/contents"
     
+    @staticmethod
+    def get_github_repo_api_url():
+        """GitHub 저장소 API URL을 생성합니다 (Git Data API용)"""
+        github_config = AppConfig.get_github_config()
+        return f"https://api.github.com/repos/{github_config['repo']}"
+    
 
     
     # 📈 UI 메시지들
@@ -2,9 +2,49 @@ import streamlit as st
 import pandas as pd
 from config import AppConfig
 
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _build_dataframe_cached(analysis_key, section, _build):
+    """표시용 DataFrame 생성 결과 캐시 (분석 시각 + 섹션 기준)
+    
+    위젯 조작마다 스크립트가 다시 실행되어도 같은 분석 결과의 표는 dict 리스트에서 다시 만들지 않습니다.
+    생성 함수(_build)는 해시하지 않으므로 키는 분석 시각과 섹션명으로만 구성됩니다.
+    
+    Args:
+        analysis_key (str): 분석 결과 식별자 (분석 timestamp)
+        section (str): 카테고리/섹션 이름
+        _build (callable): DataFrame을 만드는 함수
+        
+    Returns:
+        DataFrame: 표시용 데이터프레임
+    """
+    return _build()
+
 class DashboardRenderer:
     """대시보드 UI 렌더링을 담당하는 클래스"""
     
+    # 표 셀 배경색 (st.success/info/warning/error 색상과 맞춤)
+    STATUS_BACKGROUNDS = {
+        "success": "background-color: rgba(33, 195, 84, 0.1)",
+        "info": "background-color: rgba(28, 131, 225, 0.1)",
+        "warning": "background-color: rgba(255, 189, 69, 0.2)",
+        "error": "background-color: rgba(255, 43, 43, 0.09)"
+    }
+    
+    # 비교 기준별 표시 상태 - 목록에 없는 기준은 error
+    COMPARISON_BASIS_STYLES = {
+        "동일 용량+개수": "success",
+        "유사 용량": "info",
+        "동일 개수": "warning"
+    }
+    
+    # 시장 포지션 아이콘별 표시 상태 - 목록에 없는 포지션(💰 최고가 등)은 error
+    MARKET_POSITION_STYLES = {
+        "🎯": "success",
+        "📊": "info",
+        "📈": "warning"
+    }
+    
     def __init__(self):
         """대시보드 렌더러 초기화"""
         self.ui_messages = AppConfig.UI_MESSAGES
@@ -16,40 +56,51 @@ class DashboardRenderer:
         
         Args:
             analysis_results (dict): 분석 결과 데이터
-            json_content (str): JSON 형태의 분석 결과
+            json_content (bytes): JSON 형태의 분석 결과 (UTF-8 인코딩)
             timestamp (str): 분석 시간
-            github_success (bool): GitHub 저장 성공 여부
+            github_success (bool or None): GitHub 저장 성공 여부 (None이면 호출 측에서 저장 후 별도 표시)
         """
         if not analysis_results:
             st.error("분석 결과가 없습니다.")
             return
         
         # 성공 메시지 표시
-        if github_success:
-            st.success("✅ 분석 완료 및 GitHub 저장 성공!")
-        else:
-            st.warning("⚠️ 분석 완료, GitHub 저장 실패")
+        if github_success is not None:
+            DashboardRenderer.render_save_status(github_success)
         
         # 탭 생성
         tab_handmade, tab_all = st.tabs(["🥛 수제 제품 분석", "🏭 전체 제품 분석 (수제+공장형)"])
         
         with tab_handmade:
             DashboardRenderer.render_category_analysis(
-                analysis_results.get('handmade_category', {}), "수제"
+                analysis_results.get('handmade_category', {}), "수제", analysis_results.get('timestamp')
             )
         
         with tab_all:
             DashboardRenderer.render_category_analysis(
-                analysis_results.get('all_category', {}), "전체"
+                analysis_results.get('all_category', {}), "전체", analysis_results.get('timestamp')
             )
     
     @staticmethod
-    def render_category_analysis(category_data, category_type):
+    def render_save_status(github_success):
+        """분석 완료 및 GitHub 저장 결과 메시지 표시
+        
+        Args:
+            github_success (bool): GitHub 저장 성공 여부
+        """
+        if github_success:
+            st.success("✅ 분석 완료 및 GitHub 저장 성공!")
+        else:
+            st.warning("⚠️ 분석 완료, GitHub 저장 실패")
+    
+    @staticmethod
+    def render_category_analysis(category_data, category_type, analysis_key=None):
         """카테고리별 분석 결과 표시
         
         Args:
             category_data (dict): 카테고리 분석 데이터
             category_type (str): 카테고리 타입 (수제/전체)
+            analysis_key (str, optional): 표 캐시에 쓰는 분석 결과 식별자 (분석 timestamp)
         """
         if not category_data:
             st.warning(f"{category_type} 카테고리 데이터가 없습니다.")
@@ -63,25 +114,43 @@ class DashboardRenderer:
         # 종합 현황 표시
         st.subheader(f"🥤 서로 브랜드 종합 현황 ({category_type})")
         
-        business_insights = category_data.get('business_insights', {})
+        business_insights = category_data.get('business_insights') or {}
+        cache_key = (analysis_key, category_type)
         
         # 1. 제품별 상세 현황
-        DashboardRenderer._render_product_details(business_insights)
+        DashboardRenderer._render_product_details(business_insights, cache_key)
         
         st.markdown("---")
         
         # 2. 제품별 가격 경쟁력
-        DashboardRenderer._render_price_competitiveness(business_insights)
+        DashboardRenderer._render_price_competitiveness(business_insights, category_type)
         
         st.markdown("---")
         
         # 3. 용량별/개수별 시장 현황
-        DashboardRenderer._render_volume_market_analysis(business_insights)
+        DashboardRenderer._render_volume_market_analysis(business_insights, cache_key)
         
         st.markdown("---")
         
         # 4. 브랜드별 시장 분석
-        DashboardRenderer._render_brand_market_share(business_insights)
+        DashboardRenderer._render_brand_market_share(business_insights, cache_key)
+    
+    @staticmethod
+    def _cached_dataframe(cache_key, section, build):
+        """분석 결과 식별자가 있으면 캐시된 표를, 없으면 새로 만든 표를 반환
+        
+        Args:
+            cache_key (tuple): (분석 timestamp, 카테고리 타입)
+            section (str): 섹션 이름
+            build (callable): DataFrame을 만드는 함수
+            
+        Returns:
+            DataFrame: 표시용 데이터프레임
+        """
+        analysis_key, category_type = cache_key
+        if analysis_key is None:
+            return build()
+        return _build_dataframe_cached(analysis_key, f"{category_type}:{section}", build)
     
     @staticmethod
     def _render_key_metrics(category_data):
@@ -107,11 +176,12 @@ class DashboardRenderer:
             st.metric("🏭 경쟁사 제품", f"{competitor_count}개")
     
     @staticmethod
-    def _render_product_details(business_insights):
+    def _render_product_details(business_insights, cache_key=(None, None)):
         """제품별 상세 현황 렌더링
         
         Args:
             business_insights (dict): 비즈니스 인사이트 데이터
+            cache_key (tuple): 표 캐시 키 (분석 timestamp, 카테고리 타입)
         """
         st.markdown("### 📊 제품별 상세 현황")
         
@@ -119,7 +189,9 @@ class DashboardRenderer:
             product_details = business_insights['our_product_details']
             
             if product_details:
-                details_df = pd.DataFrame(product_details)
+                details_df = DashboardRenderer._cached_dataframe(
+                    cache_key, 'product_details', lambda: pd.DataFrame(product_details)
+                )
                 st.dataframe(details_df, use_container_width=True)
                 st.info(f"💡 총 {len(product_details)}개의 서로 브랜드 제품이 분석되었습니다.")
             else:
@@ -128,11 +200,15 @@ class DashboardRenderer:
             st.warning("제품 상세 정보가 없습니다.")
     
     @staticmethod
-    def _render_price_competitiveness(business_insights):
+    def _render_price_competitiveness(business_insights, category_type=""):
         """가격 경쟁력 렌더링
         
+        플랫폼별 상세 표는 제품 수만큼 행이 커지므로, 상태를 추적하는 expander를 사용해
+        펼쳐진 플랫폼만 렌더링합니다 (접힌 expander 내용은 전송하지 않음).
+        
         Args:
             business_insights (dict): 비즈니스 인사이트 데이터
+            category_type (str): 카테고리 타입 (위젯 키 구분용)
         """
         st.markdown("### 💰 제품별 가격 경쟁력")
         
@@ -141,8 +217,15 @@ class DashboardRenderer:
             
             if comp_data:
                 for platform, products in comp_data.items():
-                    with st.expander(f"🏪 {platform} - {len(products)}개 제품"):
-                        DashboardRenderer._render_platform_competitiveness(products)
+                    expander = st.expander(
+                        f"🏪 {platform} - {len(products)}개 제품",
+                        key=f"competitiveness_{category_type}_{platform}",
+                        on_change="rerun"
+                    )
+                    
+                    if expander.open:
+                        with expander:
+                            DashboardRenderer._render_platform_competitiveness(products)
             else:
                 st.info("제품별 경쟁력 데이터가 없습니다.")
         else:
@@ -152,101 +235,91 @@ class DashboardRenderer:
     def _render_platform_competitiveness(products):
         """플랫폼별 경쟁력 렌더링
         
+        제품마다 metric/markdown 위젯을 여러 개 그리면 위젯 수만큼 프런트엔드 메시지가 생기므로,
+        플랫폼의 모든 제품을 하나의 표로 만들어 한 번에 전송합니다.
+        
         Args:
             products (list): 플랫폼별 제품 리스트
         """
-        for product in products:
-            st.markdown(f"**{product.get('제품', 'N/A')}**")
-            
-            # 비교 기준 표시
-            comparison_basis = product.get('비교_기준', 'N/A')
-            DashboardRenderer._render_comparison_basis(comparison_basis)
-            
-            # 가격 정보 표시
-            DashboardRenderer._render_price_metrics(product)
-            
-            # 주요 경쟁사 표시
-            DashboardRenderer._render_main_competitors(product)
-            
-            st.markdown("---")
+        rows = [
+            {
+                "제품": product.get('제품', 'N/A'),
+                "비교 기준": product.get('비교_기준', 'N/A'),
+                "우리 단위가격": product.get('우리_단위가격', 'N/A'),
+                "경쟁사 평균": product.get('경쟁사_평균', 'N/A'),
+                "경쟁사 최저": product.get('경쟁사_최저', 'N/A'),
+                "경쟁사 최고": product.get('경쟁사_최고', 'N/A'),
+                "가격 차이": product.get('가격차이', 'N/A'),
+                "가격 차이(%)": product.get('가격차이_퍼센트', 'N/A'),
+                "시장 포지션": product.get('시장_포지션', 'N/A'),
+                "경쟁사 수": product.get('경쟁사_수', 0),
+                "주요 경쟁사": DashboardRenderer._format_main_competitors(product)
+            }
+            for product in products
+        ]
+        
+        styled = (
+            pd.DataFrame(rows).style
+            .map(DashboardRenderer._comparison_basis_style, subset=["비교 기준"])
+            .map(DashboardRenderer._market_position_style, subset=["시장 포지션"])
+        )
+        st.dataframe(styled, use_container_width=True, hide_index=True)
     
     @staticmethod
-    def _render_comparison_basis(comparison_basis):
-        """비교 기준 표시
+    def _comparison_basis_style(comparison_basis):
+        """비교 기준 셀 스타일 (Styler.map용)
         
         Args:
             comparison_basis (str): 비교 기준
+            
+        Returns:
+            str: CSS 스타일
         """
-        if comparison_basis == "동일 용량+개수":
-            st.success(f"🎯 **비교 기준**: {comparison_basis}")
-        elif "유사 용량" in comparison_basis:
-            st.info(f"📊 **비교 기준**: {comparison_basis}")
-        elif comparison_basis == "동일 개수":
-            st.warning(f"📈 **비교 기준**: {comparison_basis}")
-        else:
-            st.error(f"💰 **비교 기준**: {comparison_basis}")
-    
-    @staticmethod
-    def _render_price_metrics(product):
-        """가격 지표 표시
-        
-        Args:
-            product (dict): 제품 정보
-        """
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.metric("우리 단위가격", product.get('우리_단위가격', 'N/A'))
-            st.metric("경쟁사 평균", product.get('경쟁사_평균', 'N/A'))
+        styles = DashboardRenderer.COMPARISON_BASIS_STYLES
+        status = styles.get(comparison_basis)
+        if status is None and "유사 용량" in comparison_basis:
+            # 유사 용량 기준은 범위가 함께 표기되므로 포함 여부로 판단
+            status = styles["유사 용량"]
         
-        with col2:
-            st.metric("경쟁사 최저", product.get('경쟁사_최저', 'N/A'))
-            st.metric("경쟁사 최고", product.get('경쟁사_최고', 'N/A'))
-        
-        with col3:
-            st.metric("가격 차이", product.get('가격차이', 'N/A'), product.get('가격차이_퍼센트', 'N/A'))
-            
-            position = product.get('시장_포지션', 'N/A')
-            competitor_count = product.get('경쟁사_수', 0)
-            
-            DashboardRenderer._render_market_position(position, competitor_count)
+        return DashboardRenderer.STATUS_BACKGROUNDS[status or "error"]
     
     @staticmethod
-    def _render_market_position(position, competitor_count):
-        """시장 포지션 표시
+    def _market_position_style(position):
+        """시장 포지션 셀 스타일 (Styler.map용)
         
         Args:
             position (str): 시장 포지션
-            competitor_count (int): 경쟁사 수
+            
+        Returns:
+            str: CSS 스타일
         """
-        if "🎯" in position:
-            st.success(f"**{position}** (경쟁사 {competitor_count}개)")
-        elif "📊" in position:
-            st.info(f"**{position}** (경쟁사 {competitor_count}개)")
-        elif "📈" in position:
-            st.warning(f"**{position}** (경쟁사 {competitor_count}개)")
-        else:
-            st.error(f"**{position}** (경쟁사 {competitor_count}개)")
+        # 포지션 라벨은 "아이콘 설명" 형식이므로 첫 토큰으로 상태를 찾음
+        icon = position.split(' ', 1)[0]
+        status = DashboardRenderer.MARKET_POSITION_STYLES.get(icon, "error")
+        return DashboardRenderer.STATUS_BACKGROUNDS[status]
     
     @staticmethod
-    def _render_main_competitors(product):
-        """주요 경쟁사 표시
+    def _format_main_competitors(product):
+        """주요 경쟁사 목록을 표 셀용 문자열로 변환
         
         Args:
             product (dict): 제품 정보
+            
+        Returns:
+            str: 쉼표로 구분한 경쟁사 목록 (분석 전이면 빈 문자열)
         """
         main_competitors = product.get('주요_경쟁사', [])
         if main_competitors and main_competitors != ["분석 중"]:
-            st.markdown("**📋 주요 경쟁사:**")
-            for i, competitor in enumerate(main_competitors, 1):
-                st.write(f"  {i}. {competitor}")
+            return ", ".join(main_competitors)
+        return ""
     
     @staticmethod
-    def _render_volume_market_analysis(business_insights):
+    def _render_volume_market_analysis(business_insights, cache_key=(None, None)):
         """용량별 시장 분석 렌더링
         
         Args:
             business_insights (dict): 비즈니스 인사이트 데이터
+            cache_key (tuple): 표 캐시 키 (분석 timestamp, 카테고리 타입)
         """
         st.markdown("### 📊 용량별/개수별 시장 현황")
         
@@ -256,7 +329,9 @@ class DashboardRenderer:
             if market_data:
                 st.markdown("#### 🔥 인기 용량/개수 조합 (상위 10개)")
                 
-                market_df = pd.DataFrame(market_data)
+                market_df = DashboardRenderer._cached_dataframe(
+                    cache_key, 'volume_market', lambda: pd.DataFrame(market_data)
+                )
                 st.dataframe(market_df, use_container_width=True)
                 
                 # 진출 기회 시장 찾기
@@ -284,11 +359,12 @@ class DashboardRenderer:
                 st.info(f"**{volume_count}**: {total_products}개 제품, 평균 단위가격 {avg_price}")
     
     @staticmethod
-    def _render_brand_market_share(business_insights):
+    def _render_brand_market_share(business_insights, cache_key=(None, None)):
         """브랜드별 시장 점유율 렌더링
         
         Args:
             business_insights (dict): 비즈니스 인사이트 데이터
+            cache_key (tuple): 표 캐시 키 (분석 timestamp, 카테고리 타입)
         """
         st.markdown("### 🏆 브랜드별 시장 점유율")
         
@@ -296,32 +372,53 @@ class DashboardRenderer:
             share_data = business_insights['market_share']
             
             if share_data:
-                share_df = pd.DataFrame([
-                    {'브랜드': brand, '제품 수': data.get('제품_수', 0), '점유율': f"{data.get('점유율_퍼센트', 0)}%"}
-                    for brand, data in share_data.items()
-                ])
+                share_df = DashboardRenderer._cached_dataframe(
+                    cache_key, 'market_share', lambda: DashboardRenderer._build_share_dataframe(share_data)
+                )
                 
-                st.dataframe(share_df, use_container_width=True)
+                # 점유율은 숫자로 두고 % 표기는 화면에서 처리 (행마다 문자열 포맷하지 않음)
+                st.dataframe(
+                    share_df,
+                    use_container_width=True,
+                    column_config={'점유율': st.column_config.NumberColumn(format="%.1f%%")}
+                )
                 
                 # 서로 브랜드 순위 분석
-                DashboardRenderer._render_brand_ranking(share_data)
+                DashboardRenderer._render_brand_ranking(share_df)
             else:
                 st.warning("브랜드별 점유율 데이터가 없습니다.")
         else:
             st.info("브랜드별 점유율 데이터가 없습니다.")
     
     @staticmethod
-    def _render_brand_ranking(share_data):
+    def _build_share_dataframe(share_data):
+        """점유율 dict를 표시용 DataFrame으로 변환 (행 단위 반복 없이 한 번에 생성)
+        
+        Args:
+            share_data (dict): 브랜드별 점유율 데이터 (점유율 순으로 정렬됨)
+            
+        Returns:
+            DataFrame: 브랜드, 제품 수, 점유율 컬럼
+        """
+        return (
+            pd.DataFrame.from_dict(share_data, orient='index')
+            .reindex(columns=['제품_수', '점유율_퍼센트'])
+            .fillna(0)
+            .rename(columns={'제품_수': '제품 수', '점유율_퍼센트': '점유율'})
+            .rename_axis('브랜드')
+            .reset_index()
+        )
+    
+    @staticmethod
+    def _render_brand_ranking(share_df):
         """브랜드 순위 분석 렌더링
         
         Args:
-            share_data (dict): 점유율 데이터
+            share_df (DataFrame): 점유율 순으로 정렬된 점유율 표
         """
-        seoro_rank = None
-        for idx, (brand, _) in enumerate(share_data.items(), 1):
-            if brand == AppConfig.OUR_BRAND:
-                seoro_rank = idx
-                break
+        # 표는 점유율 순이고 인덱스가 0부터이므로 위치 + 1이 순위
+        our_rows = share_df.index[share_df['브랜드'] == AppConfig.OUR_BRAND]
+        seoro_rank = our_rows[0] + 1 if len(our_rows) else None
         
         if seoro_rank:
             if seoro_rank == 1:
@@ -1,14 +1,130 @@
+import os
+import hashlib
+import tempfile
+import time
 import pandas as pd
 import streamlit as st
-from datetime import datetime
+from io import BytesIO
 from config import AppConfig
 
+
+def _read_parquet_cache(cache_path):
+    """Parquet 캐시 파일 읽기
+    
+    Args:
+        cache_path (str): 캐시 파일 경로
+        
+    Returns:
+        DataFrame or None: 캐시된 데이터 (없거나 손상된 경우 None)
+    """
+    if not os.path.exists(cache_path):
+        return None
+    
+    try:
+        return pd.read_parquet(cache_path)
+    except Exception:
+        # 손상된 캐시 파일은 무시하고 엑셀에서 다시 읽음
+        return None
+
+
+def _write_parquet_cache(df, cache_path):
+    """Parquet 캐시 파일 저장 (최선 노력 - 저장할 수 없으면 캐시 없이 진행)
+    
+    Args:
+        df (DataFrame): 저장할 데이터
+        cache_path (str): 캐시 파일 경로
+    """
+    temp_path = None
+    try:
+        cache_dir = os.path.dirname(cache_path)
+        os.makedirs(cache_dir, exist_ok=True)
+        # 같은 파일을 여러 세션/스레드가 동시에 저장할 수 있으므로 임시 파일명은 매번 고유하게 생성
+        fd, temp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        os.close(fd)
+        df.to_parquet(temp_path, compression='zstd')
+        os.replace(temp_path, cache_path)
+    except Exception:
+        # 저장 실패 시 남은 임시 파일 정리
+        if temp_path is not None:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+
+def _prune_parquet_cache(cache_dir, current_suffix, max_files):
+    """Parquet 캐시 정리 (최선 노력 - 정리에 실패해도 분석은 계속 진행)
+    
+    현재 캐시 형식 버전이 아닌 파일은 모두 삭제하고, 현재 버전 파일은 최근 수정된 순으로
+    max_files개만 남깁니다. 저장 도중 프로세스가 종료되어 남은 오래된 임시 파일도 삭제합니다.
+    
+    Args:
+        cache_dir (str): 캐시 디렉토리
+        current_suffix (str): 현재 버전 캐시 파일의 접미사 (예: '.v2.parquet')
+        max_files (int): 보관할 현재 버전 캐시 파일 수
+    """
+    try:
+        all_entries = list(os.scandir(cache_dir))
+    except OSError:
+        return
+    
+    entries = [entry for entry in all_entries if entry.name.endswith('.parquet')]
+    stale = [entry for entry in entries if not entry.name.endswith(current_suffix)]
+    
+    # 다른 스레드가 쓰고 있을 수 있으므로 임시 파일은 1시간 이상 지난 것만 삭제
+    orphan_cutoff = time.time() - 60 * 60
+    for entry in all_entries:
+        if entry.name.endswith('.tmp'):
+            try:
+                if entry.stat().st_mtime < orphan_cutoff:
+                    stale.append(entry)
+            except OSError:
+                pass
+    
+    current = []
+    for entry in entries:
+        if entry.name.endswith(current_suffix):
+            try:
+                current.append((entry.stat().st_mtime, entry))
+            except OSError:
+                # 다른 스레드가 이미 삭제한 파일
+                pass
+    current.sort(key=lambda item: item[0], reverse=True)
+    stale.extend(entry for _, entry in current[max_files:])
+    
+    for entry in stale:
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass
+
+
+@st.cache_data(show_spinner=False, max_entries=32, ttl=24 * 60 * 60)
+def _load_excel_bytes_cached(file_bytes, filename):
+    """엑셀 로드 + 표준화 결과 캐시 (파일 내용 + 파일명 기준)
+    
+    Streamlit은 위젯 조작마다 스크립트를 다시 실행하므로, 원본 대신 크기가 작은
+    표준화 결과를 캐시해 재실행 시 파싱과 숫자 변환을 모두 건너뜁니다.
+    
+    Args:
+        file_bytes (bytes): 엑셀 파일 내용
+        filename (str): 원본 파일명 (플랫폼 추출용)
+        
+    Returns:
+        tuple: (정제된 DataFrame, 플랫폼명, 누락된 컬럼 리스트)
+    """
+    return DataProcessor()._load_excel_bytes(file_bytes, filename)
+
 class DataProcessor:
     """엑셀 파일 로드 및 데이터 표준화를 담당하는 클래스"""
     
+    # 표준화 결과 디스크 캐시 형식 버전 (정제 로직이 바뀌면 올려서 이전 캐시를 무시)
+    CLEAN_CACHE_VERSION = 4
+    
     def __init__(self):
         """데이터 처리기 초기화"""
         self.required_columns = AppConfig.REQUIRED_COLUMNS
+        self._required_column_set = set(self.required_columns)
         self.platform_keywords = AppConfig.PLATFORM_KEYWORDS
     
     def extract_platform_from_filename(self, filename):
@@ -39,16 +155,57 @@ class DataProcessor:
         Returns:
             tuple: (정제된 DataFrame, 플랫폼명, 누락된 컬럼 리스트)
         """
-        try:
-            # 엑셀 파일 읽기
-            df = pd.read_excel(uploaded_file, sheet_name=0)
+        return self.load_excel_bytes(uploaded_file.getvalue(), uploaded_file.name)
+    
+    def load_excel_bytes(self, file_bytes, filename):
+        """엑셀 파일 내용(bytes) 로드 및 표준화
+        
+        UploadedFile 객체는 스레드 간 공유가 안전하지 않으므로,
+        병렬 처리 시에는 미리 읽어 둔 bytes를 이 메서드에 전달합니다.
+        
+        Args:
+            file_bytes (bytes): 엑셀 파일 내용
+            filename (str): 원본 파일명 (플랫폼 추출용)
             
+        Returns:
+            tuple: (정제된 DataFrame, 플랫폼명, 누락된 컬럼 리스트)
+        """
+        return _load_excel_bytes_cached(file_bytes, filename)
+    
+    def _load_excel_bytes(self, file_bytes, filename):
+        """엑셀 파일 내용(bytes) 로드 및 표준화 (Parquet 디스크 캐시 사용)
+        
+        Args:
+            file_bytes (bytes): 엑셀 파일 내용
+            filename (str): 원본 파일명 (플랫폼 추출용)
+            
+        Returns:
+            tuple: (정제된 DataFrame, 플랫폼명, 누락된 컬럼 리스트)
+        """
+        try:
             # 플랫폼 추출
-            platform = self.extract_platform_from_filename(uploaded_file.name)
+            platform = self.extract_platform_from_filename(filename)
+            
+            # 이전에 표준화한 결과가 있으면 엑셀 파싱과 정제를 모두 건너뜀
+            cache_path = self._get_clean_cache_path(file_bytes, filename)
+            df_clean = _read_parquet_cache(cache_path)
+            
+            if df_clean is None:
+                # calamine(Rust) 엔진은 openpyxl의 순수 Python XML 파싱보다 빠르고 .xls도 지원
+                # 필수 컬럼만 읽어 나머지 컬럼은 DataFrame으로 만들지 않음
+                df = pd.read_excel(
+                    BytesIO(file_bytes),
+                    sheet_name=0,
+                    engine='calamine',
+                    usecols=self._is_required_column
+                )
+                file_columns = set(df.columns)
+            else:
+                file_columns = set(df_clean.columns)
             
             # 사용 가능한 컬럼과 누락된 컬럼 확인
-            available_columns = [col for col in self.required_columns if col in df.columns]
-            missing_columns = [col for col in self.required_columns if col not in df.columns]
+            available_columns = [col for col in self.required_columns if col in file_columns]
+            missing_columns = [col for col in self.required_columns if col not in file_columns]
             
             # 누락된 컬럼이 있으면 경고 표시
             if missing_columns:
@@ -60,7 +217,14 @@ class DataProcessor:
                 return None, None, None
             
             # 데이터 정제 수행
-            df_clean = self._clean_data(df, available_columns, platform)
+            if df_clean is None:
+                df_clean = self._clean_data(df, available_columns, platform)
+                _write_parquet_cache(df_clean, cache_path)
+                _prune_parquet_cache(
+                    os.path.dirname(cache_path),
+                    f".v{self.CLEAN_CACHE_VERSION}.parquet",
+                    AppConfig.PROCESSING_SETTINGS['excel_cache_max_files']
+                )
             
             return df_clean, platform, missing_columns
             
@@ -68,6 +232,34 @@ class DataProcessor:
             st.error(f"파일 처리 중 오류: {str(e)}")
             return None, None, None
     
+    def _is_required_column(self, column):
+        """엑셀 헤더가 필수 컬럼인지 확인 (read_excel usecols용)
+        
+        Args:
+            column (str): 엑셀 헤더 이름
+            
+        Returns:
+            bool: 읽어야 하는 컬럼 여부
+        """
+        return column in self._required_column_set
+    
+    def _get_clean_cache_path(self, file_bytes, filename):
+        """표준화 결과 Parquet 캐시 경로 생성
+        
+        플랫폼이 파일명에서 결정되므로 파일 내용과 파일명을 함께 키로 사용합니다.
+        
+        Args:
+            file_bytes (bytes): 엑셀 파일 내용
+            filename (str): 원본 파일명
+            
+        Returns:
+            str: 캐시 파일 경로
+        """
+        digest = hashlib.sha1(file_bytes)
+        digest.update(filename.encode('utf-8'))
+        cache_dir = AppConfig.PROCESSING_SETTINGS['excel_cache_dir']
+        return os.path.join(cache_dir, f"{digest.hexdigest()}.v{self.CLEAN_CACHE_VERSION}.parquet")
+    
     def _clean_data(self, df, available_columns, platform):
         """데이터 정제 및 표준화
         
@@ -79,27 +271,52 @@ class DataProcessor:
         Returns:
             DataFrame: 정제된 데이터프레임
         """
-        # 필요한 컬럼만 추출
-        df_clean = df[available_columns].copy()
+        # 필요한 컬럼만 추출하고, 필수 데이터가 없는 행은 변환 작업 전에 한 번에 제거
+        essential_columns = [col for col in ['브랜드', '제품명'] if col in available_columns]
+        df_clean = df[available_columns].dropna(subset=essential_columns).copy()
         
-        # 메타데이터 추가
+        # 메타데이터 추가 (분석 시각은 행마다 두지 않고 분석 결과의 timestamp로 관리)
         df_clean['플랫폼'] = platform
-        df_clean['분석_시간'] = datetime.now().strftime('%Y-%m-%d %H:%M')
         
-        # 숫자형 컬럼 변환
-        numeric_columns = self._get_numeric_columns()
-        for col in numeric_columns:
-            if col in df_clean.columns:
-                df_clean[col] = pd.to_numeric(df_clean[col], errors='coerce')
+        # 숫자형 컬럼 변환 (이미 숫자형인 컬럼은 건너뛰고 나머지를 한 번에 변환)
+        columns_to_convert = [
+            col for col in self._get_numeric_columns()
+            if col in df_clean.columns and not pd.api.types.is_numeric_dtype(df_clean[col])
+        ]
+        if columns_to_convert:
+            df_clean[columns_to_convert] = df_clean[columns_to_convert].apply(pd.to_numeric, errors='coerce')
         
-        # 필수 데이터가 없는 행 제거
-        essential_columns = ['브랜드', '제품명']
-        for col in essential_columns:
-            if col in df_clean.columns:
-                df_clean = df_clean.dropna(subset=[col])
+        # 값 범위에 맞는 작은 dtype으로 변환 (메모리 절감)
+        self._downcast_numeric_columns(df_clean)
         
         return df_clean
     
+    def _downcast_numeric_columns(self, df_clean):
+        """분석에 쓰이는 숫자형 컬럼을 float64보다 작은 dtype으로 변환
+        
+        가격은 1e6 이하, 개수는 1e3 이하이므로 32비트/16비트로 충분합니다.
+        용량은 소수점 용량(예: 180.5ml)이 있을 수 있어 정수가 아닌 float32로 둡니다.
+        
+        Args:
+            df_clean (DataFrame): 숫자형 변환이 끝난 데이터프레임 (제자리 수정)
+        """
+        compact_dtypes = {
+            '용량(ml)': 'float32',
+            '개수': 'Int16',
+            '최저가(배송비 포함)': 'float32',
+            '최저가 단위가격(100ml당)': 'float32',
+            # 공장형 여부는 0/1 플래그 - nullable Int8로 두면 결측은 수제 필터(== 0)에서 자동 제외
+            '공장형 여부': 'Int8'
+        }
+        
+        for col, dtype in compact_dtypes.items():
+            if col in df_clean.columns:
+                try:
+                    df_clean[col] = df_clean[col].astype(dtype)
+                except (TypeError, ValueError):
+                    # 소수점 개수처럼 정수로 표현할 수 없는 값이 있으면 기존 dtype 유지
+                    pass
+    
     def _get_numeric_columns(self):
         """숫자형으로 변환해야 하는 컬럼 리스트 반환
         
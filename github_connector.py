@@ -1,22 +1,66 @@
 import streamlit as st
 import requests
-import json
 import base64
+import orjson
+import threading
+import time
 from datetime import datetime
 from config import AppConfig
 
 class GitHubStorage:
     """GitHub 저장소와의 연동을 담당하는 클래스"""
     
+    # 분석 결과 JSON 직렬화 옵션 (numpy 스칼라 및 비문자열 키 허용)
+    # 들여쓰기 없이 저장해 업로드 크기를 줄임
+    JSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    
+    # Git Data API 일괄 삭제는 파일 수와 관계없이 요청 6번(저장소/ref/커밋/트리/커밋/ref 갱신)이 필요하므로
+    # 파일별 DELETE보다 요청이 적어지는 경우에만 사용
+    BATCH_DELETE_MIN_FILES = 7
+    
     def __init__(self):
         """GitHub 연동 초기화"""
         self.github_config = AppConfig.get_github_config()
         self.token = self.github_config['token']
         self.repo = self.github_config['repo']
         self.api_url = AppConfig.get_github_api_url()
+        self.repo_api_url = AppConfig.get_github_repo_api_url()
         
         # GitHub 연결 상태 확인
         self.is_connected = bool(self.token)
+        
+        # GitHub 요청용 세션 (TCP/TLS 연결 재사용) 및 목록 캐시
+        # 백그라운드 업로드 스레드는 use_dedicated_session()으로 자기 세션을 따로 사용
+        self._shared_session = requests.Session()
+        self._thread_local = threading.local()
+        self.listing_ttl = AppConfig.PROCESSING_SETTINGS['github_listing_ttl']
+        self._listing_cache = {'etag': None, 'files': None, 'fetched_at': 0.0}
+        
+        # 같은 객체를 여러 세션/스레드가 공유하므로 캐시는 잠금 안에서 dict 전체를 교체
+        # 세대 번호는 무효화될 때마다 증가 - 요청 도중 무효화되었으면 그 응답으로 캐시를 갱신하지 않음
+        self._cache_lock = threading.Lock()
+        self._listing_generation = 0
+        
+        # 마지막으로 내려받은 분석 결과 파일 (blob sha가 같으면 내용도 같으므로 재다운로드 생략)
+        self._download_cache = {'sha': None, 'content': None}
+    
+    @property
+    def session(self):
+        """현재 스레드에서 사용할 requests 세션 (전용 세션이 없으면 공유 세션)
+        
+        Returns:
+            requests.Session: HTTP 세션
+        """
+        return getattr(self._thread_local, 'session', None) or self._shared_session
+    
+    def use_dedicated_session(self):
+        """현재 스레드 전용 requests 세션 사용 (백그라운드 업로드 스레드용)
+        
+        세션 객체는 스레드 간 동시 사용이 안전하지 않으므로, 스크립트 실행과 동시에 도는
+        업로드 작업은 공유 세션 대신 자기 세션으로 요청합니다.
+        """
+        if getattr(self._thread_local, 'session', None) is None:
+            self._thread_local.session = requests.Session()
     
     def check_connection(self):
         """GitHub 연결 상태 확인
@@ -29,7 +73,7 @@ class GitHubStorage:
         
         try:
             headers = self._get_headers()
-            response = requests.get(self.api_url, headers=headers, timeout=10)
+            response = self.session.get(self.api_url, headers=headers, timeout=10)
             
             if response.status_code == 200:
                 return True, "GitHub 연결 성공"
@@ -58,6 +102,57 @@ class GitHubStorage:
             "Accept": "application/vnd.github.v3+json"
         }
     
+    def _fetch_directory_listing(self, timeout=15):
+        """저장소 디렉토리의 파일 목록 조회 (짧은 TTL 캐시 + ETag 조건부 요청)
+        
+        불러오기/정리/히스토리 조회가 연달아 같은 목록을 요청하므로, TTL 동안은 캐시를 그대로 쓰고
+        TTL이 지나면 If-None-Match로 조건부 요청합니다. 304 응답은 API 사용량에 포함되지 않습니다.
+        
+        Args:
+            timeout (int): 요청 제한 시간 (초)
+            
+        Returns:
+            tuple: (HTTP 상태 코드, 파일 목록 또는 None)
+        """
+        with self._cache_lock:
+            cache = self._listing_cache
+            generation = self._listing_generation
+        now = time.time()
+        
+        if cache['files'] is not None and now - cache['fetched_at'] < self.listing_ttl:
+            return 200, cache['files']
+        
+        headers = self._get_headers()
+        if cache['etag'] and cache['files'] is not None:
+            headers['If-None-Match'] = cache['etag']
+        
+        response = self.session.get(self.api_url, headers=headers, timeout=timeout)
+        
+        if response.status_code == 304:
+            with self._cache_lock:
+                if self._listing_generation == generation and self._listing_cache is cache:
+                    self._listing_cache = {**cache, 'fetched_at': now}
+            return 200, cache['files']
+        
+        if response.status_code == 200:
+            files = response.json()
+            with self._cache_lock:
+                if self._listing_generation == generation:
+                    self._listing_cache = {
+                        'etag': response.headers.get('ETag'),
+                        'files': files,
+                        'fetched_at': now
+                    }
+            return 200, files
+        
+        return response.status_code, None
+    
+    def _invalidate_directory_listing(self):
+        """파일 저장/삭제 후 목록 캐시 무효화 (다음 조회는 조건부 요청으로 갱신)"""
+        with self._cache_lock:
+            self._listing_generation += 1
+            self._listing_cache = {**self._listing_cache, 'fetched_at': 0.0}
+    
     def load_latest_analysis(self):
         """GitHub에서 최신 분석 결과 불러오기
         
@@ -69,12 +164,9 @@ class GitHubStorage:
             return None
         
         try:
-            headers = self._get_headers()
-            response = requests.get(self.api_url, headers=headers, timeout=15)
+            status_code, files = self._fetch_directory_listing()
             
-            if response.status_code == 200:
-                files = response.json()
-                
+            if status_code == 200:
                 # 분석 결과 파일 찾기
                 analysis_files = [
                     f for f in files 
@@ -85,11 +177,12 @@ class GitHubStorage:
                     # 가장 최신 파일 선택 (파일명 기준)
                     latest_file = max(analysis_files, key=lambda x: x['name'])
                     
-                    # 파일 내용 다운로드
-                    file_response = requests.get(latest_file['download_url'], timeout=15)
+                    # 파일 내용 다운로드 (목록의 sha가 이전 다운로드와 같으면 캐시 사용)
+                    file_content = self._download_file_content(latest_file)
                     
-                    if file_response.status_code == 200:
-                        analysis_data = json.loads(file_response.text)
+                    if file_content is not None:
+                        # bytes를 str로 디코딩하지 않고 바로 파싱 (호출마다 새 dict 생성)
+                        analysis_data = orjson.loads(file_content)
                         
                         # 메타데이터 추가
                         analysis_data['_github_metadata'] = {
@@ -101,16 +194,16 @@ class GitHubStorage:
                         
                         return analysis_data
                     else:
-                        st.error(f"파일 다운로드 실패: {file_response.status_code}")
+                        st.error(f"파일 다운로드 실패: {latest_file['name']}")
                 else:
                     st.info("저장된 분석 결과 파일이 없습니다.")
                 
-            elif response.status_code == 401:
+            elif status_code == 401:
                 st.error("GitHub 토큰이 유효하지 않습니다.")
-            elif response.status_code == 404:
+            elif status_code == 404:
                 st.error("GitHub 저장소를 찾을 수 없습니다.")
             else:
-                st.error(f"GitHub API 오류: {response.status_code}")
+                st.error(f"GitHub API 오류: {status_code}")
                 
             return None
             
@@ -120,13 +213,35 @@ class GitHubStorage:
         except requests.exceptions.ConnectionError:
             st.error("GitHub 연결 오류")
             return None
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             st.error("분석 결과 파일 형식 오류")
             return None
         except Exception as e:
             st.error(f"GitHub에서 분석 결과 로드 중 오류: {str(e)}")
             return None
     
+    def _download_file_content(self, file_info):
+        """파일 내용 다운로드 (blob sha 기준 캐시)
+        
+        Args:
+            file_info (dict): 디렉토리 목록의 파일 정보 (download_url, sha 포함)
+            
+        Returns:
+            bytes or None: 파일 내용 또는 다운로드 실패 시 None
+        """
+        with self._cache_lock:
+            cache = self._download_cache
+        if cache['sha'] == file_info['sha'] and cache['content'] is not None:
+            return cache['content']
+        
+        file_response = self.session.get(file_info['download_url'], timeout=15)
+        if file_response.status_code != 200:
+            return None
+        
+        with self._cache_lock:
+            self._download_cache = {'sha': file_info['sha'], 'content': file_response.content}
+        return file_response.content
+    
     def save_analysis_results(self, analysis_data, custom_filename=None):
         """GitHub에 분석 결과 저장
         
@@ -149,22 +264,23 @@ class GitHubStorage:
                 timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
                 filename = f"analysis_results_{timestamp}.json"
             
-            # JSON 콘텐츠 생성
-            json_content = json.dumps(analysis_data, ensure_ascii=False, indent=2)
-            content_encoded = base64.b64encode(json_content.encode('utf-8')).decode()
+            # JSON 콘텐츠 생성 (orjson은 UTF-8 bytes를 바로 반환하므로 재인코딩 불필요)
+            json_bytes = orjson.dumps(analysis_data, option=self.JSON_OPTIONS)
+            content_encoded = base64.b64encode(json_bytes).decode('ascii')
             
-            # GitHub API 요청
+            # GitHub API 요청 (큰 base64 문자열이 포함되므로 요청 본문도 orjson으로 직렬화)
             url = f"{self.api_url}/{filename}"
-            headers = self._get_headers()
+            headers = {**self._get_headers(), "Content-Type": "application/json"}
             
             data = {
                 "message": f"📊 수정과 시장 분석 결과 업데이트: {datetime.now().strftime('%Y-%m-%d %H:%M')}",
                 "content": content_encoded,
             }
             
-            response = requests.put(url, headers=headers, json=data, timeout=20)
+            response = self.session.put(url, headers=headers, data=orjson.dumps(data), timeout=20)
             
             if response.status_code in [200, 201]:
+                self._invalidate_directory_listing()
                 st.success(f"✅ GitHub에 분석 결과 저장 완료: {filename}")
                 return True, filename
             else:
@@ -197,11 +313,9 @@ class GitHubStorage:
         
         try:
             headers = self._get_headers()
-            response = requests.get(self.api_url, headers=headers, timeout=15)
+            status_code, files = self._fetch_directory_listing()
             
-            if response.status_code == 200:
-                files = response.json()
-                
+            if status_code == 200:
                 # 분석 결과 파일들 찾기
                 analysis_files = [
                     f for f in files 
@@ -219,25 +333,96 @@ class GitHubStorage:
                 files_to_delete = analysis_files[keep_latest:]
                 deleted_count = 0
                 
-                for file_info in files_to_delete:
-                    delete_success = self._delete_file(file_info, headers)
-                    if delete_success:
-                        deleted_count += 1
-                    else:
-                        st.warning(f"파일 삭제 실패: {file_info['name']}")
+                # 삭제할 파일이 많으면 하나의 커밋으로 일괄 삭제하고, 적거나 실패하면 파일별 삭제
+                use_batch = len(files_to_delete) >= self.BATCH_DELETE_MIN_FILES
+                if use_batch and self._delete_files_batch(files_to_delete, headers):
+                    deleted_count = len(files_to_delete)
+                else:
+                    for file_info in files_to_delete:
+                        delete_success = self._delete_file(file_info, headers)
+                        if delete_success:
+                            deleted_count += 1
+                        else:
+                            st.warning(f"파일 삭제 실패: {file_info['name']}")
                 
                 if deleted_count > 0:
+                    self._invalidate_directory_listing()
                     st.success(f"✅ {deleted_count}개의 이전 분석 결과 파일이 정리되었습니다.")
                 
                 return True, deleted_count
             else:
-                st.error(f"GitHub 파일 목록 조회 실패: {response.status_code}")
+                st.error(f"GitHub 파일 목록 조회 실패: {status_code}")
                 return False, 0
                 
         except Exception as e:
             st.error(f"GitHub 파일 정리 중 오류: {str(e)}")
             return False, 0
     
+    def _delete_files_batch(self, files_to_delete, headers):
+        """여러 파일을 하나의 커밋으로 삭제 (Git Data API)
+        
+        Contents API는 파일마다 DELETE 요청과 커밋이 필요하므로, 기본 브랜치의 트리에서
+        대상 경로들을 한 번에 제거한 새 커밋을 만들고 브랜치를 갱신합니다.
+        파일 수와 관계없이 요청 수가 일정합니다 (6번 - BATCH_DELETE_MIN_FILES 참고).
+        
+        Args:
+            files_to_delete (list): 삭제할 파일 정보 리스트
+            headers (dict): API 헤더
+            
+        Returns:
+            bool: 일괄 삭제 성공 여부
+        """
+        try:
+            # 기본 브랜치와 최신 커밋 조회
+            repo_response = self.session.get(self.repo_api_url, headers=headers, timeout=15)
+            if repo_response.status_code != 200:
+                return False
+            branch = repo_response.json()['default_branch']
+            
+            ref_response = self.session.get(f"{self.repo_api_url}/git/ref/heads/{branch}", headers=headers, timeout=15)
+            if ref_response.status_code != 200:
+                return False
+            base_commit_sha = ref_response.json()['object']['sha']
+            
+            commit_response = self.session.get(f"{self.repo_api_url}/git/commits/{base_commit_sha}", headers=headers, timeout=15)
+            if commit_response.status_code != 200:
+                return False
+            base_tree_sha = commit_response.json()['tree']['sha']
+            
+            # sha를 null로 지정한 항목은 새 트리에서 제거됨
+            tree_data = {
+                "base_tree": base_tree_sha,
+                "tree": [
+                    {"path": file_info.get('path', file_info['name']), "mode": "100644", "type": "blob", "sha": None}
+                    for file_info in files_to_delete
+                ]
+            }
+            tree_response = self.session.post(f"{self.repo_api_url}/git/trees", headers=headers, json=tree_data, timeout=20)
+            if tree_response.status_code != 201:
+                return False
+            
+            commit_data = {
+                "message": f"정리: 이전 분석 결과 {len(files_to_delete)}개 삭제",
+                "tree": tree_response.json()['sha'],
+                "parents": [base_commit_sha]
+            }
+            new_commit_response = self.session.post(f"{self.repo_api_url}/git/commits", headers=headers, json=commit_data, timeout=20)
+            if new_commit_response.status_code != 201:
+                return False
+            
+            # 브랜치가 그 사이 갱신되었으면 fast-forward가 아니므로 실패 (파일별 삭제로 대체)
+            update_response = self.session.patch(
+                f"{self.repo_api_url}/git/refs/heads/{branch}",
+                headers=headers,
+                json={"sha": new_commit_response.json()['sha']},
+                timeout=15
+            )
+            
+            return update_response.status_code == 200
+            
+        except Exception:
+            return False
+    
     def _delete_file(self, file_info, headers):
         """개별 파일 삭제
         
@@ -255,7 +440,7 @@ class GitHubStorage:
                 "sha": file_info['sha']
             }
             
-            delete_response = requests.delete(
+            delete_response = self.session.delete(
                 delete_url, 
                 headers=headers, 
                 json=delete_data, 
@@ -280,12 +465,9 @@ class GitHubStorage:
             return []
         
         try:
-            headers = self._get_headers()
-            response = requests.get(self.api_url, headers=headers, timeout=15)
+            status_code, files = self._fetch_directory_listing()
             
-            if response.status_code == 200:
-                files = response.json()
-                
+            if status_code == 200:
                 # 분석 결과 파일들 찾기
                 analysis_files = [
                     f for f in files 
@@ -364,11 +546,9 @@ class GitHubStorage:
         if self.is_connected:
             try:
                 # 연결 상태 및 파일 수 확인
-                headers = self._get_headers()
-                response = requests.get(self.api_url, headers=headers, timeout=10)
+                status_code, files = self._fetch_directory_listing(timeout=10)
                 
-                if response.status_code == 200:
-                    files = response.json()
+                if status_code == 200:
                     analysis_files = [
                         f for f in files 
                         if f['name'].startswith('analysis_results') and f['name'].endswith('.json')
@@ -383,7 +563,7 @@ class GitHubStorage:
                 else:
                     info.update({
                         'status': 'error',
-                        'error_code': response.status_code
+                        'error_code': status_code
                     })
             except Exception as e:
                 info.update({